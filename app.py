@@ -1,48 +1,548 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
-import plotly.express as px
+import plotly.graph_objects as go
+from plotly.colors import qualitative
+import plotly.io as pio
+import calendar
+import hashlib
 import os
+import shutil
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+import zipfile
+from io import BytesIO
+from itertools import islice
+import openpyxl
 
 # Streamlit page configuration
 st.set_page_config(page_title="✈️ Flight Dashboard", layout="wide")
 
+# Serialize figures with orjson, which is much faster than the standard json module
+pio.json.config.default_engine = "orjson"
+
 # Function to load data from local Excel file
 # Direct download URL from Google Drive
 file_url = "https://drive.google.com/uc?id=1yZOgxaEroxK6_qmzwiTDwT4aDPlA5RB6"
 
-@st.cache_data
+# Month number -> month name, for labelling the month filter (index 0 is unused)
+MONTH_NAMES = list(calendar.month_name)
+
+# Cleaned copies of the data are kept here so restarts skip the download, Excel parsing and cleanup
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data_cache")
+# The sheet can be edited in place on Drive, so both the cached file and the in-memory copy
+# are refreshed from the source once they are older than this
+CACHE_TTL_SECONDS = 60 * 60
+
+def download_file(url):
+    # Stream the file to a temporary path instead of holding it in memory
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        try:
+            with urllib.request.urlopen(url) as response:
+                shutil.copyfileobj(response, tmp)
+        except BaseException:
+            # Don't leave a partial download behind; load_data only cleans up paths it gets back
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+    return tmp.name
+
+def cache_path_for(url):
+    # The ".prepared" suffix keeps older cache files, which held the raw sheet, from being reused
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".prepared.parquet")
+
+def save_cache(df, path):
+    # Write to a temporary name first so a failed write never leaves a broken cache file
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Parquet can't store columns that mix numbers and text. Only raw columns the dashboard
+        # never parses can still be mixed at this point, so storing those as text is safe
+        mixed_cols = {
+            col: "string" for col, dtype in df.dtypes.items()
+            if dtype == object and pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+        }
+        df = df.astype(mixed_cols)
+        df.to_parquet(tmp_path, compression="zstd")
+        # Only keep the cache if reading it back gives exactly the frame that was saved
+        if not pd.read_parquet(tmp_path).equals(df):
+            raise ValueError("Parquet round trip changed the data")
+        os.replace(tmp_path, path)
+    except Exception:
+        # The dashboard still works without the cache, it just reloads the workbook next time
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def read_workbook_openpyxl(source, chunk_size=10_000):
+    # Read-only mode streams rows instead of loading the whole workbook model into memory
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source) as response:
+            source = BytesIO(response.read())
+    wb = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, ())
+        # Build the frame in batches so only one batch of row tuples is held at a time
+        chunks = []
+        while batch := list(islice(rows, chunk_size)):
+            chunks.append(pd.DataFrame(batch, columns=header))
+    finally:
+        wb.close()
+
+    if not chunks:
+        return pd.DataFrame(columns=header)
+    return pd.concat(chunks, ignore_index=True).dropna(how="all")
+
+def detect_format(path):
+    # Google Drive links carry no file extension, so sniff the file contents instead
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic == b"PAR1":
+        return "parquet"
+    if magic == b"\xd0\xcf\x11\xe0":
+        return "xls"
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            if "xl/workbook.bin" in zf.namelist():
+                return "xlsb"
+    return "xlsx"
+
+def format_from_url(url):
+    # Best guess from the extension when the file can't be inspected
+    ext = os.path.splitext(urllib.parse.urlparse(url).path)[1].lower().lstrip(".")
+    return ext if ext in ("parquet", "xls", "xlsb") else "xlsx"
+
+def read_workbook(source, fmt="xlsx"):
+    if fmt == "parquet":
+        return pd.read_parquet(source)
+
+    # calamine (Rust) parses xlsx, xlsb and xls far faster than the pure-Python readers,
+    # which are kept for files it can't handle
+    try:
+        return pd.read_excel(source, engine="calamine")
+    except Exception:
+        if fmt == "xlsb":
+            return pd.read_excel(source, engine="pyxlsb")
+        if fmt == "xls":
+            return pd.read_excel(source, engine="xlrd")
+        return read_workbook_openpyxl(source)
+
 def load_data(url):
     try:
-        df = pd.read_excel(url, engine="openpyxl")
-        return df
-    except Exception as e:
-        st.error(f"❌ Failed to load Excel file: {e}")
+        tmp_path = download_file(url)
+        try:
+            df = read_workbook(tmp_path, detect_format(tmp_path))
+        finally:
+            os.remove(tmp_path)
+    except Exception:
+        # Fall back to letting pandas read straight from the URL
+        try:
+            df = read_workbook(url, format_from_url(url))
+        except Exception as e:
+            st.error(f"❌ Failed to load Excel file: {e}")
+            return None
+    return df
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS)
+def prepare_data(url):
+    cache_path = cache_path_for(url)
+
+    # Reuse the copy cleaned on an earlier run if there is one and it hasn't expired
+    if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < CACHE_TTL_SECONDS:
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass
+
+    df = load_data(url)
+    if df is None:
         return None
-    
-# Load data from Google Drive
-df = load_data(file_url)
 
-if df is not None:
     # Clean and convert date
     df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
     df.dropna(subset=["Date"], inplace=True)
 
     # Add Year and Month for filtering
-    df["Year"] = df["Date"].dt.year
-    df["Month"] = df["Date"].dt.month
-    df["Month_Name"] = df["Date"].dt.strftime("%B")
+    df["Year"] = df["Date"].dt.year.astype("int16")
+    df["Month"] = df["Date"].dt.month.astype("int8")
 
     # Fix and convert numeric columns
     numeric_cols = ["Total Price", "Commission", "No Passengers"]
     for col in numeric_cols:
-        if col in df.columns:
-            df[col] = df[col].replace(["NaN", "nan", "NAN", "Null", "NULL", "", " "], pd.NA)
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+        # Columns the reader already parsed as numbers need no cleanup
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            # Arrow-backed strings strip in native code; placeholders like "NaN", "Null"
+            # or blanks fail to parse and become NaN
+            df[col] = pd.to_numeric(df[col].astype("string[pyarrow]").str.strip(), errors="coerce")
 
     # Safe integer conversion
     if "No Passengers" in df.columns:
-        df["No Passengers"] = df["No Passengers"].fillna(0).astype(int)
+        df["No Passengers"] = df["No Passengers"].fillna(0).astype("int32")
+
+    # Low-cardinality text columns as categories, so groupbys hash integer codes instead of strings
+    for col in ["Type", "Payment Method", "Airport", "From", "To"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    # Create Route column for route analysis
+    if "From" in df.columns and "To" in df.columns:
+        # Built from plain objects so the categories keep the default text dtype, which is what
+        # Parquet gives back (missing endpoints still give a missing route)
+        df["Route"] = (df["From"].astype(object) + " → " + df["To"].astype(object)).astype("category")
+
+    # Flag "No Tickets" rows once so filtering is a boolean mask; blank ticket numbers count as ticketed
+    df["_is_ticketed"] = (
+        df["Ticket Numbers"].astype("string").str.casefold().ne("no tickets").fillna(True).astype(bool)
+    )
+
+    save_cache(df, cache_path)
+    return df
+
+def filter_data(df, years, months):
+    # Combine the filters into one mask so the frame is indexed only once
+    mask = np.ones(len(df), dtype=bool)
+    if years:
+        mask &= df["Year"].isin(years).to_numpy()
+    if months:
+        mask &= df["Month"].isin(months).to_numpy()
+    return df[mask]
+
+def get_ticketed_df(filtered_df):
+    # Filter out "No Tickets"
+    ticketed_df = filtered_df[filtered_df["_is_ticketed"]]
+
+    # Drop rows with missing price or commission
+    return ticketed_df.dropna(subset=["Total Price", "Commission"])
+
+# Cached per filter selection (years and months as tuples). Only the small aggregated frames
+# are kept, and only for the most recent selections; the row-level frames are cheaper to
+# recompute than to unpickle from the cache, so the data is only reloaded here on a cache miss
+@st.cache_data(max_entries=32)
+def compute_aggregations(url, years, months):
+    # All chart aggregations in one place; sums and counts sharing a key come from a single groupby
+    ticketed_df = get_ticketed_df(filter_data(prepare_data(url), years, months))
+
+    top_dests = (
+        ticketed_df.groupby("To", observed=True)["Total Price"]
+        .sum()
+        .sort_values(ascending=False)
+        .head(10)
+        .reset_index()
+    )
+
+    route_agg = (
+        ticketed_df.groupby('Route', observed=True)
+        .agg({
+            'Commission': 'sum',
+            'Total Price': 'sum',
+            'No Passengers': 'sum'
+        })
+        .reset_index()
+    )
+    top_routes_commission = route_agg.sort_values('Commission', ascending=False).head(15)
+
+    # "size" counts the rows in each group; it is attached to Commission only to name the output
+    type_agg = (
+        ticketed_df.groupby("Type", observed=True)
+        .agg(Commission=("Commission", "sum"), Count=("Commission", "size"))
+        .reset_index()
+    )
+    type_commission = type_agg[["Type", "Commission"]].sort_values("Commission", ascending=False)
+    type_counts = type_agg[["Type", "Count"]]
+
+    # Ticket price ranges, binned left-closed: [0, 5K), [5K, 10K), ... [100K, inf)
+    bins = np.array([0, 5000, 10000, 15000, 20000, 30000, 40000, 60000, 100000, np.inf])
+    labels = ["0–5K", "5K–10K", "10K–15K", "15K–20K", "20K–30K", "30K–40K", "40K–60K", "60K–100K", "100K+"]
+    prices = ticketed_df["Total Price"].to_numpy(dtype="float64")
+    commissions = ticketed_df["Commission"].to_numpy(dtype="float64")
+    in_range = (prices >= bins[0]) & (prices < bins[-1])
+    prices, commissions = prices[in_range], commissions[in_range]
+    # Bucket index per ticket, then count and sum every bucket in one pass each
+    bucket = np.searchsorted(bins[1:-1], prices, side="right")
+    ticket_count = np.bincount(bucket, minlength=len(labels))
+    price_sum = np.bincount(bucket, weights=prices, minlength=len(labels))
+    range_counts = pd.DataFrame({
+        "Fixed Price Range": labels,
+        "Ticket_Count": ticket_count,
+        "Total_Commission": np.bincount(bucket, weights=commissions, minlength=len(labels)),
+        "Avg_Ticket_Price": np.divide(
+            price_sum, ticket_count, out=np.full(len(labels), np.nan), where=ticket_count > 0
+        ),
+    })
+
+    payment_agg = (
+        ticketed_df.groupby("Payment Method", observed=True)
+        .agg(Commission=("Commission", "sum"), Count=("Commission", "size"))
+        .reset_index()
+    )
+    bank_df = (
+        payment_agg[["Payment Method", "Commission"]]
+        .sort_values("Commission", ascending=False)
+        .head(10)
+    )
+    payment_counts = payment_agg[["Payment Method", "Count"]].sort_values("Count", ascending=False)
+
+    airport_agg = (
+        ticketed_df.groupby("Airport", observed=True)
+        .agg(**{
+            "Commission": ("Commission", "sum"),
+            "Total Price": ("Total Price", "sum"),
+            "Number of Bookings": ("Commission", "size")
+        })
+        .reset_index()
+    )
+    airport_commission = (
+        airport_agg[["Airport", "Commission"]]
+        .sort_values("Commission", ascending=False)
+        .head(10)
+    )
+    airport_sales = (
+        airport_agg[["Airport", "Total Price"]]
+        .sort_values("Total Price", ascending=False)
+        .head(10)
+    )
+    airport_bookings = (
+        airport_agg[["Airport", "Number of Bookings"]]
+        .sort_values("Number of Bookings", ascending=False)
+        .head(15)
+    )
+
+    return {
+        "type_counts": type_counts,
+        "top_dests": top_dests,
+        "top_routes_commission": top_routes_commission,
+        "type_commission": type_commission,
+        "range_counts": range_counts,
+        "bank_df": bank_df,
+        "payment_counts": payment_counts,
+        "airport_commission": airport_commission,
+        "airport_sales": airport_sales,
+        "airport_bookings": airport_bookings,
+    }
+
+# Plotly options shared by every chart
+PLOTLY_CONFIG = {"displaylogo": False, "responsive": True}
 
+def style_chart(fig):
+    # No transition animation, keep zoom/legend state across reruns, and skip bar outlines
+    fig.update_layout(uirevision="constant", transition={"duration": 0})
+    fig.update_traces(marker_line_width=0, selector={"type": "bar"})
+    return fig
+
+def show_chart(fig):
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+
+# Figures are cached on their input values (passed as tuples), so a rerun whose aggregates
+# didn't change reuses the built figure. Cached figures are shared, so they are never modified after this.
+# The limits hold about two filter selections' worth (8 bar charts and 2 pies per selection)
+@st.cache_resource(max_entries=16)
+def build_bar_fig(x_vals, y_vals, title, x_title, y_title, colorscale=None, colors=None,
+                  texttemplate=None, tickangle=None):
+    # The same (already top-N) values serve as both bar heights and colour values
+    y = list(y_vals)
+    if colors:
+        marker = dict(color=list(colors))
+    else:
+        marker = dict(color=y, colorscale=colorscale, showscale=True)
+    fig = go.Figure(go.Bar(
+        x=list(x_vals),
+        y=y,
+        marker=marker,
+        texttemplate=texttemplate,
+        textposition='outside' if texttemplate else None
+    ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, xaxis_tickangle=tickangle)
+    return style_chart(fig)
+
+@st.cache_resource(max_entries=4)
+def build_pie_fig(labels, values, title, colors):
+    fig = go.Figure(go.Pie(
+        labels=list(labels),
+        values=list(values),
+        hole=0.4,
+        marker=dict(colors=list(colors)),
+        textinfo="percent+label"
+    ))
+    fig.update_layout(title=title)
+    return style_chart(fig)
+
+# Each tab is a fragment, reading its data from the compute_aggregations cache. The tabs have
+# no widgets of their own yet, so every rerun comes from the sidebar filters and reruns the
+# whole script: the split is structural only and gives no speedup until a tab gets a widget
+@st.fragment
+def render_route_tab(url, years, months):
+    aggs = compute_aggregations(url, years, months)
+
+    # Pie chart by Type
+    st.subheader("🌍 Route Type: Domestic vs International")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        type_counts = aggs["type_counts"]
+        fig_type = build_pie_fig(
+            tuple(type_counts["Type"].tolist()),
+            tuple(type_counts["Count"].tolist()),
+            title="Flight Type Distribution",
+            colors=tuple(qualitative.Set2)
+        )
+        show_chart(fig_type)
+
+    with col2:
+        # Top 10 Destinations
+        st.subheader("🏁 Top 10 Destinations")
+        top_dests = aggs["top_dests"]
+        fig_dest = build_bar_fig(
+            tuple(top_dests["To"].tolist()),
+            tuple(top_dests["Total Price"].tolist()),
+            title="Top Destinations by Total Price",
+            x_title="Destination",
+            y_title="Total Price (ETB)",
+            colorscale="viridis"
+        )
+        show_chart(fig_dest)
+
+    # NEW: Top Routes by Commission
+    st.subheader("💸 Top Routes by Commission")
+
+    # Calculate top routes by commission
+    top_routes_commission = aggs["top_routes_commission"]
+
+    fig_routes_commission = build_bar_fig(
+        tuple(top_routes_commission['Route'].tolist()),
+        tuple(top_routes_commission['Commission'].tolist()),
+        title='Profitable Routes by Commission Earned',
+        x_title='From → To',
+        y_title='Total Commission (ETB)',
+        colorscale='greens',
+        texttemplate='%{y:,.0f}',
+        tickangle=-45
+    )
+    show_chart(fig_routes_commission)
+
+@st.fragment
+def render_financials_tab(url, years, months):
+    aggs = compute_aggregations(url, years, months)
+
+    st.subheader("💰 Commission by Route Type")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        type_commission = aggs["type_commission"]
+        fig_commission_type = build_bar_fig(
+            tuple(type_commission["Type"].tolist()),
+            tuple(type_commission["Commission"].tolist()),
+            title="💳 Total Commission by Flight Type",
+            x_title="Flight Type",
+            y_title="Commission (ETB)",
+            colorscale="Blues",
+            texttemplate='%{y:,.0f}'
+        )
+        show_chart(fig_commission_type)
+
+    with col2:
+        # Ticket Price Range Distribution
+        st.subheader("🎯 Ticket Price Distribution")
+        range_counts = aggs["range_counts"]
+
+        fig_fixed = build_bar_fig(
+            tuple(range_counts["Fixed Price Range"].tolist()),
+            tuple(range_counts["Ticket_Count"].tolist()),
+            title="🎫 Ticket Count by Price Range",
+            x_title="Price Range",
+            y_title="Tickets",
+            colors=tuple(qualitative.Safe[:len(range_counts)]),
+            texttemplate='%{y}',
+            tickangle=-45
+        )
+        show_chart(fig_fixed)
+
+@st.fragment
+def render_payment_tab(url, years, months):
+    aggs = compute_aggregations(url, years, months)
+
+    st.subheader("🏦 Payment Analysis")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Commission by Payment Method
+        bank_df = aggs["bank_df"]
+        fig_bank = build_bar_fig(
+            tuple(bank_df["Payment Method"].tolist()),
+            tuple(bank_df["Commission"].tolist()),
+            title="Top Banks by Commission",
+            x_title="Payment Method",
+            y_title="Commission",
+            colorscale="Plasma"
+        )
+        show_chart(fig_bank)
+
+    with col2:
+        # Payment method distribution
+        payment_counts = aggs["payment_counts"]
+        fig_payment = build_pie_fig(
+            tuple(payment_counts["Payment Method"].tolist()),
+            tuple(payment_counts["Count"].tolist()),
+            title="Most Used Payment Methods",
+            colors=tuple(qualitative.Pastel)
+        )
+        show_chart(fig_payment)
+
+@st.fragment
+def render_airport_tab(url, years, months):
+    aggs = compute_aggregations(url, years, months)
+
+    st.subheader("🏢 Airport Performance Analysis")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Airport by Commission
+        airport_commission = aggs["airport_commission"]
+        fig_airport_comm = build_bar_fig(
+            tuple(airport_commission["Airport"].tolist()),
+            tuple(airport_commission["Commission"].tolist()),
+            title="🏢 Top Airports by Commission",
+            x_title="Airport",
+            y_title="Total Commission (ETB)",
+            colorscale="teal",
+            texttemplate='%{y:,.0f}'
+        )
+        show_chart(fig_airport_comm)
+
+    with col2:
+        # Airport by Ticket Sales
+        airport_sales = aggs["airport_sales"]
+        fig_airport_sales = build_bar_fig(
+            tuple(airport_sales["Airport"].tolist()),
+            tuple(airport_sales["Total Price"].tolist()),
+            title="🏢 Top Airports by Sales",
+            x_title="Airport",
+            y_title="Total Sales (ETB)",
+            colorscale="oranges",
+            texttemplate='%{y:,.0f}'
+        )
+        show_chart(fig_airport_sales)
+
+    # Airport by Number of Bookings
+    st.subheader("📊 Airport Booking Volume")
+    airport_bookings = aggs["airport_bookings"]
+
+    fig_airport_volume = build_bar_fig(
+        tuple(airport_bookings["Airport"].tolist()),
+        tuple(airport_bookings["Number of Bookings"].tolist()),
+        title="Most Active Airports by Number of Bookings",
+        x_title="Airport",
+        y_title="Number of Bookings",
+        colorscale="purples",
+        texttemplate='%{y}'
+    )
+    show_chart(fig_airport_volume)
+
+# Load data from Google Drive
+df = prepare_data(file_url)
+
+if df is not None:
     # Sidebar Filters - SIMPLIFIED VERSION
     st.sidebar.header("📅 Filter by Year & Month")
     
@@ -56,28 +556,25 @@ if df is not None:
     )
     
     # Month filter
-    available_months = sorted(df["Month_Name"].unique(), key=lambda x: pd.to_datetime(x, format='%B').month)
+    available_months = sorted(df["Month"].unique().tolist())
     selected_months = st.sidebar.multiselect(
         "Select Months", 
         available_months, 
         default=available_months,
+        format_func=lambda month: MONTH_NAMES[month],
         help="Choose one or multiple months"
     )
 
     # Apply filters
-    filtered_df = df.copy()
-    
-    if selected_years:
-        filtered_df = filtered_df[filtered_df["Year"].isin(selected_years)]
-    if selected_months:
-        filtered_df = filtered_df[filtered_df["Month_Name"].isin(selected_months)]
+    years, months = tuple(selected_years), tuple(selected_months)
+    filtered_df = filter_data(df, years, months)
 
     # Display active filters
     st.sidebar.header("📊 Active Filters")
     if selected_years:
         st.sidebar.success(f"**Years:** {', '.join(map(str, selected_years))}")
     if selected_months:
-        st.sidebar.success(f"**Months:** {', '.join(selected_months)}")
+        st.sidebar.success(f"**Months:** {', '.join(MONTH_NAMES[month] for month in selected_months)}")
     
     # Show date range of filtered data
     if not filtered_df.empty:
@@ -85,11 +582,7 @@ if df is not None:
         max_date = filtered_df["Date"].max().strftime("%b %d, %Y")
         st.sidebar.info(f"**Date Range:** {min_date} to {max_date}")
 
-    # Filter out "No Tickets"
-    ticketed_df = filtered_df[filtered_df["Ticket Numbers"].astype(str).str.lower() != "no tickets"]
-
-    # Drop rows with missing price or commission
-    ticketed_df = ticketed_df.dropna(subset=["Total Price", "Commission"])
+    ticketed_df = get_ticketed_df(filtered_df)
 
     # Dashboard Title
     st.title("✈️ Flight Booking Dashboard")
@@ -110,230 +603,16 @@ if df is not None:
     tab1, tab2, tab3, tab4 = st.tabs(["🌍 Route Analysis", "💰 Financials", "🏦 Payment Methods", "🏢 Airport Analysis"])
 
     with tab1:
-        # Create Route column for route analysis
-        ticketed_df['Route'] = ticketed_df['From'] + ' → ' + ticketed_df['To']
-        
-        # Pie chart by Type
-        st.subheader("🌍 Route Type: Domestic vs International")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_type = px.pie(ticketed_df, names="Type", title="Flight Type Distribution", hole=0.4,
-                            color_discrete_sequence=px.colors.qualitative.Set2)
-            fig_type.update_traces(textinfo="percent+label")
-            st.plotly_chart(fig_type, use_container_width=True)
-
-        with col2:
-            # Top 10 Destinations
-            st.subheader("🏁 Top 10 Destinations")
-            top_dests = (
-                ticketed_df.groupby("To")["Total Price"]
-                .sum()
-                .sort_values(ascending=False)
-                .head(10)
-                .reset_index()
-            )
-            fig_dest = px.bar(
-                top_dests,
-                x="To",
-                y="Total Price",
-                title="Top Destinations by Total Price",
-                labels={"To": "Destination", "Total Price": "Total Price (ETB)"},
-                color="Total Price",
-                color_continuous_scale="viridis"
-            )
-            st.plotly_chart(fig_dest, use_container_width=True)
-
-        # NEW: Top Routes by Commission
-        st.subheader("💸 Top Routes by Commission")
-        
-        # Calculate top routes by commission
-        top_routes_commission = (
-            ticketed_df.groupby('Route')
-            .agg({
-                'Commission': 'sum',
-                'Total Price': 'sum',
-                'No Passengers': 'sum'
-            })
-            .reset_index()
-            .sort_values('Commission', ascending=False)
-            .head(15)
-        )
-        
-        fig_routes_commission = px.bar(
-            top_routes_commission,
-            x='Route',
-            y='Commission',
-            title='Profitable Routes by Commission Earned',
-            labels={'Route': 'From → To', 'Commission': 'Total Commission (ETB)'},
-            color='Commission',
-            color_continuous_scale='greens'
-        )
-        fig_routes_commission.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-        fig_routes_commission.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig_routes_commission, use_container_width=True)
+        render_route_tab(file_url, years, months)
 
     with tab2:
-        st.subheader("💰 Commission by Route Type")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            type_commission = (
-                ticketed_df.dropna(subset=["Type"])
-                .groupby("Type")["Commission"]
-                .sum()
-                .reset_index()
-                .sort_values("Commission", ascending=False)
-            )
-            fig_commission_type = px.bar(
-                type_commission,
-                x="Type",
-                y="Commission",
-                title="💳 Total Commission by Flight Type",
-                labels={"Type": "Flight Type", "Commission": "Total Commission (ETB)"},
-                color="Commission",
-                color_continuous_scale="Blues"
-            )
-            fig_commission_type.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-            fig_commission_type.update_layout(yaxis_title="Commission (ETB)", xaxis_title="Flight Type")
-            st.plotly_chart(fig_commission_type, use_container_width=True)
-
-        with col2:
-            # Ticket Price Range Distribution
-            st.subheader("🎯 Ticket Price Distribution")
-            price_df = ticketed_df.copy()
-            bins = [0, 5000, 10000, 15000, 20000, 30000, 40000, 60000, 100000, float("inf")]
-            labels = ["0–5K", "5K–10K", "10K–15K", "15K–20K", "20K–30K", "30K–40K", "40K–60K", "60K–100K", "100K+"]
-            price_df["Fixed Price Range"] = pd.cut(price_df["Total Price"], bins=bins, labels=labels, right=False)
-
-            range_counts = (
-                price_df.groupby("Fixed Price Range")
-                .agg(
-                    Ticket_Count=("Fixed Price Range", "count"),
-                    Total_Commission=("Commission", "sum"),
-                    Avg_Ticket_Price=("Total Price", "mean")
-                )
-                .reset_index()
-            )
-
-            fig_fixed = px.bar(
-                range_counts,
-                x="Fixed Price Range",
-                y="Ticket_Count",
-                text="Ticket_Count",
-                color="Fixed Price Range",
-                title="🎫 Ticket Count by Price Range",
-                labels={"Ticket_Count": "Number of Tickets"},
-                color_discrete_sequence=px.colors.qualitative.Safe
-            )
-            fig_fixed.update_traces(textposition='outside')
-            fig_fixed.update_layout(xaxis_title="Price Range", yaxis_title="Tickets", xaxis_tickangle=-45)
-            st.plotly_chart(fig_fixed, use_container_width=True)
+        render_financials_tab(file_url, years, months)
 
     with tab3:
-        st.subheader("🏦 Payment Analysis")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Commission by Payment Method
-            bank_df = (
-                ticketed_df.groupby("Payment Method")["Commission"]
-                .sum()
-                .reset_index()
-                .sort_values("Commission", ascending=False)
-                .head(10)
-            )
-            fig_bank = px.bar(
-                bank_df,
-                x="Payment Method",
-                y="Commission",
-                title="Top Banks by Commission",
-                color="Commission",
-                color_continuous_scale="Plasma"
-            )
-            st.plotly_chart(fig_bank, use_container_width=True)
-
-        with col2:
-            # Payment method distribution
-            payment_counts = ticketed_df["Payment Method"].value_counts().reset_index()
-            payment_counts.columns = ["Payment Method", "Count"]
-            fig_payment = px.pie(
-                payment_counts,
-                names="Payment Method",
-                values="Count",
-                hole=0.4,
-                title="Most Used Payment Methods",
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            fig_payment.update_traces(textinfo="percent+label")
-            st.plotly_chart(fig_payment, use_container_width=True)
+        render_payment_tab(file_url, years, months)
 
     with tab4:
-        st.subheader("🏢 Airport Performance Analysis")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Airport by Commission
-            airport_commission = (
-                ticketed_df.groupby("Airport")["Commission"]
-                .sum()
-                .reset_index()
-                .sort_values("Commission", ascending=False)
-                .head(10)
-            )
-            fig_airport_comm = px.bar(
-                airport_commission,
-                x="Airport",
-                y="Commission",
-                title="🏢 Top Airports by Commission",
-                labels={"Commission": "Total Commission (ETB)"},
-                color="Commission",
-                color_continuous_scale="teal"
-            )
-            fig_airport_comm.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-            st.plotly_chart(fig_airport_comm, use_container_width=True)
-
-        with col2:
-            # Airport by Ticket Sales
-            airport_sales = (
-                ticketed_df.groupby("Airport")["Total Price"]
-                .sum()
-                .reset_index()
-                .sort_values("Total Price", ascending=False)
-                .head(10)
-            )
-            fig_airport_sales = px.bar(
-                airport_sales,
-                x="Airport",
-                y="Total Price",
-                title="🏢 Top Airports by Sales",
-                labels={"Total Price": "Total Sales (ETB)"},
-                color="Total Price",
-                color_continuous_scale="oranges"
-            )
-            fig_airport_sales.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-            st.plotly_chart(fig_airport_sales, use_container_width=True)
-
-        # Airport by Number of Bookings
-        st.subheader("📊 Airport Booking Volume")
-        airport_bookings = (
-            ticketed_df["Airport"]
-            .value_counts()
-            .reset_index()
-            .head(15)
-        )
-        airport_bookings.columns = ["Airport", "Number of Bookings"]
-        
-        fig_airport_volume = px.bar(
-            airport_bookings,
-            x="Airport",
-            y="Number of Bookings",
-            title="Most Active Airports by Number of Bookings",
-            color="Number of Bookings",
-            color_continuous_scale="purples"
-        )
-        fig_airport_volume.update_traces(texttemplate='%{y}', textposition='outside')
-        st.plotly_chart(fig_airport_volume, use_container_width=True)
+        render_airport_tab(file_url, years, months)
 
 else:
     st.warning("📤 Please check if the Excel file exists at the specified path.")
@@ -344,4 +623,7 @@ else:
        - Date, PNR, Payment Method, From, To, Airport, Type
        - Base Total Price, Total Price, Commission, No Passengers, Ticket Numbers
     3. Restart the application
+
+    For large files, prefer exporting to `.xlsb` (binary Excel) or `.parquet`; they load much faster than `.xlsx`.
+    Loaded data is cached in `.data_cache/` for an hour; delete that folder to pick up changes sooner.
     """)
\ No newline at end of file